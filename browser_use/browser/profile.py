@@ -1,37 +1,90 @@
+import logging
 import os
+import re
 import sys
-from collections.abc import Iterable
-from enum import Enum
-from functools import cache
+from functools import cache, lru_cache
 from pathlib import Path
 from re import Pattern
 from typing import Annotated, Any, Literal, Self
-from urllib.parse import urlparse
-from venv import logger
-
-from playwright._impl._api_structures import (
-	ClientCertificate,
-	Geolocation,
-	HttpCredentials,
-	ProxySettings,
-	StorageState,
-	ViewportSize,
-)
-from pydantic import AfterValidator, AliasChoices, BaseModel, ConfigDict, Field, model_validator
+
+from pydantic import AfterValidator, AliasChoices, BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 # fix pydantic error on python 3.11
 # PydanticUserError: Please use `typing_extensions.TypedDict` instead of `typing.TypedDict` on Python < 3.12.
 # For further information visit https://errors.pydantic.dev/2.10/u/typed-dict-version
 if sys.version_info < (3, 12):
 	from typing_extensions import TypedDict
+else:
+	from typing import TypedDict
+
+# ===== Playwright structured types =====
+# local copies of the TypedDicts from playwright._impl._api_structures (same field names & types),
+# so that building / validating a BrowserProfile doesn't need to import playwright until a browser is actually launched
+
+
+class ViewportSize(TypedDict):
+	width: int
+	height: int
+
+
+class ProxySettings(TypedDict, total=False):
+	server: str
+	bypass: str | None
+	username: str | None
+	password: str | None
+
+
+class Geolocation(TypedDict, total=False):
+	latitude: float
+	longitude: float
+	accuracy: float | None
+
+
+class HttpCredentials(TypedDict, total=False):
+	username: str
+	password: str
+	origin: str | None
+	send: Literal['always', 'unauthorized'] | None
+
+
+class ClientCertificate(TypedDict, total=False):
+	origin: str
+	certPath: str | Path | None
+	cert: bytes | None
+	keyPath: str | Path | None
+	key: bytes | None
+	pfxPath: str | Path | None
+	pfx: bytes | None
+	passphrase: str | None
+
+
+class StorageStateCookie(TypedDict, total=False):
+	name: str
+	value: str
+	domain: str
+	path: str
+	expires: float
+	httpOnly: bool
+	secure: bool
+	sameSite: Literal['Lax', 'None', 'Strict']
+
+
+class LocalStorageEntry(TypedDict):
+	name: str
+	value: str
+
+
+class OriginState(TypedDict):
+	origin: str
+	localStorage: list[LocalStorageEntry]
+
 
-	# convert new-style typing.TypedDict used by playwright to old-style typing_extensions.TypedDict used by pydantic
-	ClientCertificate = TypedDict('ClientCertificate', ClientCertificate.__annotations__, total=ClientCertificate.__total__)
-	Geolocation = TypedDict('Geolocation', Geolocation.__annotations__, total=Geolocation.__total__)
-	ProxySettings = TypedDict('ProxySettings', ProxySettings.__annotations__, total=ProxySettings.__total__)
-	ViewportSize = TypedDict('ViewportSize', ViewportSize.__annotations__, total=ViewportSize.__total__)
-	HttpCredentials = TypedDict('HttpCredentials', HttpCredentials.__annotations__, total=HttpCredentials.__total__)
-	StorageState = TypedDict('StorageState', StorageState.__annotations__, total=StorageState.__total__)
+class StorageState(TypedDict, total=False):
+	cookies: list[StorageStateCookie]
+	origins: list[OriginState]
+
+
+logger = logging.getLogger(__name__)
 
 IN_DOCKER = os.environ.get('IN_DOCKER', 'false').lower()[0] in 'ty1'
 CHROME_DEBUG_PORT = 9242  # use a non-default port to avoid conflicts with other tools / devs using 9222
@@ -193,28 +246,42 @@ CHROME_DEFAULT_ARGS = [
 
 @cache
 def get_display_size() -> ViewportSize | None:
-	# macOS
-	try:
-		from AppKit import NSScreen
+	"""
+	Returns the size of the primary display, or None if it can't be detected.
 
-		screen = NSScreen.mainScreen().frame()
-		return ViewportSize(width=int(screen.size.width), height=int(screen.size.height))
-	except Exception:
-		pass
+	AppKit / screeninfo are imported lazily here and only for the current platform,
+	so nothing pays their import cost until a session actually needs the display size.
+	"""
+	if sys.platform == 'darwin':
+		# macOS
+		try:
+			from AppKit import NSScreen
+
+			screen = NSScreen.mainScreen().frame()
+			return ViewportSize(width=int(screen.size.width), height=int(screen.size.height))
+		except Exception:
+			pass
+	else:
+		# Windows & Linux
+		try:
+			from screeninfo import get_monitors
+
+			monitors = get_monitors()
+			monitor = monitors[0]
+			return ViewportSize(width=int(monitor.width), height=int(monitor.height))
+		except Exception:
+			pass
 
-	# Windows & Linux
-	try:
-		from screeninfo import get_monitors
+	return None
 
-		monitors = get_monitors()
-		monitor = monitors[0]
-		return ViewportSize(width=int(monitor.width), height=int(monitor.height))
-	except Exception:
-		pass
 
-	return None
+def _get_display_size_copy() -> ViewportSize | None:
+	"""Returns a fresh copy of the cached get_display_size() result, safe to store on (and mutate through) a profile."""
+	display_size = get_display_size()
+	return ViewportSize(**display_size) if display_size else None
 
 
+@cache
 def get_window_adjustments() -> tuple[int, int]:
 	"""Returns recommended x, y offsets for window positioning"""
 
@@ -226,101 +293,90 @@ def get_window_adjustments() -> tuple[int, int]:
 		return 0, 0
 
 
-# ===== Validator functions =====
-
-BROWSERUSE_CONFIG_DIR = Path('~/.config/browseruse')
-BROWSERUSE_PROFILES_DIR = BROWSERUSE_CONFIG_DIR / 'profiles'
-
-
-def validate_url(url: str, schemes: Iterable[str] = ()) -> str:
-	"""Validate URL format and optionally check for specific schemes."""
-	parsed_url = urlparse(url)
-	if not parsed_url.netloc:
-		raise ValueError(f'Invalid URL format: {url}')
-	if schemes and parsed_url.scheme and parsed_url.scheme.lower() not in schemes:
-		raise ValueError(f'URL has invalid scheme: {url} (expected one of {schemes})')
-	return url
-
-
-def validate_float_range(value: float, min_val: float, max_val: float) -> float:
-	"""Validate that float is within specified range."""
-	if not min_val <= value <= max_val:
-		raise ValueError(f'Value {value} outside of range {min_val}-{max_val}')
-	return value
-
-
-def validate_cli_arg(arg: str) -> str:
-	"""Validate that arg is a valid CLI argument."""
-	if not arg.startswith('--'):
-		raise ValueError(f'Invalid CLI argument: {arg} (should start with --, e.g. --some-key="some value here")')
-	return arg
+# {expanded absolute dir path: resolved dir path} for the dirs already created by prepare_user_data_dir() in this process
+_PREPARED_DIRS: dict[str, Path] = {}
 
 
-# ===== Enum definitions =====
+def _prepare_dir(dir_path: str | Path) -> Path:
+	"""Expand, resolve and create a directory, skipping the resolve/mkdir syscalls if it was already prepared before."""
+	# key on the absolute path (not the configured string) so relative paths still follow the current working directory,
+	# already-absolute paths (e.g. the defaults) don't need expanding
+	key = os.fspath(dir_path) if os.path.isabs(dir_path) else os.path.abspath(os.path.expanduser(dir_path))
+	prepared_dir = _PREPARED_DIRS.get(key)
+	if prepared_dir is None or not prepared_dir.is_dir():
+		# always canonicalize (.. and symlinks), the path ends up in --user-data-dir= and is compared as a string
+		prepared_dir = Path(key).resolve()
+		if not prepared_dir.is_dir():
+			prepared_dir.mkdir(parents=True, exist_ok=True)
+		_PREPARED_DIRS[key] = _PREPARED_DIRS[str(prepared_dir)] = prepared_dir
+	return prepared_dir
 
 
-class ColorScheme(str, Enum):
-	LIGHT = 'light'
-	DARK = 'dark'
-	NO_PREFERENCE = 'no-preference'
-	NULL = 'null'
-
-
-class Contrast(str, Enum):
-	NO_PREFERENCE = 'no-preference'
-	MORE = 'more'
-	NULL = 'null'
-
-
-class ReducedMotion(str, Enum):
-	REDUCE = 'reduce'
-	NO_PREFERENCE = 'no-preference'
-	NULL = 'null'
-
-
-class ForcedColors(str, Enum):
-	ACTIVE = 'active'
-	NONE = 'none'
-	NULL = 'null'
-
+# ===== Validator functions =====
 
-class ServiceWorkers(str, Enum):
-	ALLOW = 'allow'
-	BLOCK = 'block'
+BROWSERUSE_CONFIG_DIR = Path('~/.config/browseruse').expanduser()  # expanded once here so defaults derived from it are absolute
+BROWSERUSE_PROFILES_DIR = BROWSERUSE_CONFIG_DIR / 'profiles'
 
 
-class RecordHarContent(str, Enum):
-	OMIT = 'omit'
-	EMBED = 'embed'
-	ATTACH = 'attach'
+# optional RFC 3986 scheme followed by //netloc, the only parts of the URL validate_url() checks
+_URL_SCHEME_NETLOC_RE = re.compile(r'(?:([A-Za-z][A-Za-z0-9+.-]*):)?//([^/?#]*)')
 
 
-class RecordHarMode(str, Enum):
-	FULL = 'full'
-	MINIMAL = 'minimal'
+@lru_cache(maxsize=1024)
+def validate_url(url: str, schemes: tuple[str, ...] = ()) -> str:
+	"""Validate URL format and optionally check for specific schemes."""
+	# only the scheme and netloc are checked, so a prefix match is enough instead of a full urlparse()
+	match = _URL_SCHEME_NETLOC_RE.match(url)
+	if not match or not match.group(2):
+		raise ValueError(f'Invalid URL format: {url}')
+	scheme = match.group(1)
+	if schemes and scheme and scheme.lower() not in schemes:
+		raise ValueError(f'URL has invalid scheme: {url} (expected one of {schemes})')
+	return url
 
 
-class BrowserChannel(str, Enum):
-	CHROMIUM = 'chromium'
-	CHROME = 'chrome'
-	CHROME_BETA = 'chrome-beta'
-	CHROME_DEV = 'chrome-dev'
-	CHROME_CANARY = 'chrome-canary'
-	MSEDGE = 'msedge'
-	MSEDGE_BETA = 'msedge-beta'
-	MSEDGE_DEV = 'msedge-dev'
-	MSEDGE_CANARY = 'msedge-canary'
+# ===== Literal type definitions =====
+
+ColorScheme = Literal['light', 'dark', 'no-preference', 'null']
+Contrast = Literal['no-preference', 'more', 'null']
+ReducedMotion = Literal['reduce', 'no-preference', 'null']
+ForcedColors = Literal['active', 'none', 'null']
+ServiceWorkers = Literal['allow', 'block']
+RecordHarContent = Literal['omit', 'embed', 'attach']
+RecordHarMode = Literal['full', 'minimal']
+BrowserChannel = Literal[
+	'chromium',
+	'chrome',
+	'chrome-beta',
+	'chrome-dev',
+	'chrome-canary',
+	'msedge',
+	'msedge-beta',
+	'msedge-dev',
+	'msedge-canary',
+]
 
 
 # ===== Type definitions with validators =====
 
 UrlStr = Annotated[str, AfterValidator(validate_url)]
-NonNegativeFloat = Annotated[float, AfterValidator(lambda x: validate_float_range(x, 0, float('inf')))]
-CliArgStr = Annotated[str, AfterValidator(validate_cli_arg)]
+NonNegativeFloat = Annotated[float, Field(ge=0)]
 
 
 # ===== Base Models =====
 
+# model configs shared by the context-args models and the launch-args models (instead of a separate identical dict per class)
+_CONTEXT_ARGS_CONFIG = ConfigDict(extra='ignore', validate_assignment=False, revalidate_instances='always', populate_by_name=True)
+_LAUNCH_ARGS_CONFIG = ConfigDict(
+	extra='ignore',
+	validate_assignment=True,
+	revalidate_instances='always',
+	from_attributes=True,
+	validate_by_name=True,
+	validate_by_alias=True,
+	populate_by_name=True,
+)
+
 
 class BrowserContextArgs(BaseModel):
 	"""
@@ -330,7 +386,7 @@ class BrowserContextArgs(BaseModel):
 	https://playwright.dev/python/docs/api/class-browser#browser-new-context
 	"""
 
-	model_config = ConfigDict(extra='ignore', validate_assignment=False, revalidate_instances='always', populate_by_name=True)
+	model_config = _CONTEXT_ARGS_CONFIG
 
 	# Browser context parameters
 	accept_downloads: bool = True
@@ -352,7 +408,7 @@ class BrowserContextArgs(BaseModel):
 	ignore_https_errors: bool = False
 	java_script_enabled: bool = True
 	base_url: UrlStr | None = None
-	service_workers: ServiceWorkers = ServiceWorkers.ALLOW
+	service_workers: ServiceWorkers = 'allow'
 
 	# Viewport options
 	user_agent: str | None = None
@@ -365,14 +421,14 @@ class BrowserContextArgs(BaseModel):
 	locale: str | None = None
 	geolocation: Geolocation | None = None
 	timezone_id: str | None = None
-	color_scheme: ColorScheme = ColorScheme.LIGHT
-	contrast: Contrast = Contrast.NO_PREFERENCE
-	reduced_motion: ReducedMotion = ReducedMotion.NO_PREFERENCE
-	forced_colors: ForcedColors = ForcedColors.NONE
+	color_scheme: ColorScheme = 'light'
+	contrast: Contrast = 'no-preference'
+	reduced_motion: ReducedMotion = 'no-preference'
+	forced_colors: ForcedColors = 'none'
 
 	# Recording Options
-	record_har_content: RecordHarContent = RecordHarContent.EMBED
-	record_har_mode: RecordHarMode = RecordHarMode.FULL
+	record_har_content: RecordHarContent = 'embed'
+	record_har_mode: RecordHarMode = 'full'
 	record_har_omit_content: bool = False
 	record_har_path: str | Path | None = None
 	record_har_url_filter: str | Pattern | None = None
@@ -393,7 +449,7 @@ class BrowserConnectArgs(BaseModel):
 
 	headers: dict[str, str] | None = Field(default=None, description='Additional HTTP headers to be sent with connect request')
 	slow_mo: float = 0.0
-	timeout: float = 30_000
+	timeout: float = 30_000.0
 
 
 class BrowserLaunchArgs(BaseModel):
@@ -404,15 +460,7 @@ class BrowserLaunchArgs(BaseModel):
 	https://playwright.dev/python/docs/api/class-browsertype#browser-type-launch
 	"""
 
-	model_config = ConfigDict(
-		extra='ignore',
-		validate_assignment=True,
-		revalidate_instances='always',
-		from_attributes=True,
-		validate_by_name=True,
-		validate_by_alias=True,
-		populate_by_name=True,
-	)
+	model_config = _LAUNCH_ARGS_CONFIG
 
 	env: dict[str, str | float | bool] = Field(
 		default_factory=dict, description='Extra environment variables to set when launching the browser.'
@@ -423,22 +471,20 @@ class BrowserLaunchArgs(BaseModel):
 		description='Path to the chromium-based browser executable to use.',
 	)
 	headless: bool | None = Field(default=None, description='Whether to run the browser in headless or windowed mode.')
-	args: list[CliArgStr] = Field(
-		default_factory=list, description='List of *extra* CLI args to pass to the browser when launching.'
-	)
-	ignore_default_args: list[CliArgStr] | Literal[True] = Field(
+	args: list[str] = Field(default_factory=list, description='List of *extra* CLI args to pass to the browser when launching.')
+	ignore_default_args: list[str] | Literal[True] = Field(
 		default_factory=lambda: ['--enable-automation', '--disable-extensions'],
 		description='List of default CLI args to stop playwright from applying (see https://github.com/microsoft/playwright/blob/41008eeddd020e2dee1c540f7c0cdfa337e99637/packages/playwright-core/src/server/chromium/chromiumSwitches.ts)',
 	)
-	channel: BrowserChannel = BrowserChannel.CHROMIUM  # https://playwright.dev/docs/browsers#chromium-headless-shell
+	channel: BrowserChannel = 'chromium'  # https://playwright.dev/docs/browsers#chromium-headless-shell
 	chromium_sandbox: bool = Field(
 		default=not IN_DOCKER, description='Whether to enable Chromium sandboxing (recommended unless inside Docker).'
 	)
 	devtools: bool = Field(
 		default=False, description='Whether to open DevTools panel automatically for every page, only works when headless=False.'
 	)
-	slow_mo: float = Field(default=0, description='Slow down actions by this many milliseconds.')
-	timeout: float = Field(default=30000, description='Default timeout in milliseconds for connecting to a remote browser.')
+	slow_mo: float = Field(default=0.0, description='Slow down actions by this many milliseconds.')
+	timeout: float = Field(default=30_000.0, description='Default timeout in milliseconds for connecting to a remote browser.')
 	proxy: ProxySettings | None = Field(default=None, description='Proxy settings to use to connect to the browser.')
 	downloads_path: str | Path | None = Field(default=None, description='Directory to save downloads to.')
 	traces_dir: str | Path | None = Field(default=None, description='Directory to save HAR trace files to.')
@@ -459,12 +505,21 @@ class BrowserLaunchArgs(BaseModel):
 		assert not (self.headless and self.devtools), 'headless=True and devtools=True cannot both be set at the same time'
 		return self
 
+	@model_validator(mode='after')
+	def validate_cli_args(self) -> Self:
+		"""Validate that all args and ignore_default_args are valid CLI arguments (checked in one pass, not per-item)."""
+		ignore_default_args = self.ignore_default_args if isinstance(self.ignore_default_args, list) else ()
+		invalid_arg = next((arg for arg in (*self.args, *ignore_default_args) if not arg.startswith('--')), None)
+		if invalid_arg is not None:
+			raise ValueError(f'Invalid CLI argument: {invalid_arg} (should start with --, e.g. --some-key="some value here")')
+		return self
+
 	@staticmethod
 	def args_as_dict(args: list[str]) -> dict[str, str]:
 		"""Return the extra launch CLI args as a dictionary."""
 		args_dict = {}
 		for arg in args:
-			key, value, *_ = [*arg.split('=', 1), '', '', '']
+			key, _, value = arg.partition('=')
 			args_dict[key.strip().lstrip('-')] = value.strip()
 		return args_dict
 
@@ -474,6 +529,21 @@ class BrowserLaunchArgs(BaseModel):
 		return [f'--{key.lstrip("-")}={value}' if value else f'--{key.lstrip("-")}' for key, value in args.items()]
 
 
+def _parse_static_args(args: list[str]) -> dict[str, str]:
+	"""Pre-parse a static CHROME_*_ARGS list, interning the keys since get_args() hashes & compares them on every call."""
+	return {sys.intern(key): value for key, value in BrowserLaunchArgs.args_as_dict(args).items()}
+
+
+# pre-parsed forms of the static CHROME_*_ARGS lists, so get_args() only has to parse the user-supplied args on each call
+_CHROME_DEFAULT_ARGS_DICT = _parse_static_args(CHROME_DEFAULT_ARGS)
+del _CHROME_DEFAULT_ARGS_DICT['disable-features']  # merged separately from _CHROME_DEFAULT_DISABLED_FEATURES
+_CHROME_DEFAULT_DISABLED_FEATURES = dict.fromkeys(sys.intern(feature) for feature in CHROME_DISABLED_COMPONENTS)
+_CHROME_DOCKER_ARGS_DICT = _parse_static_args(CHROME_DOCKER_ARGS)
+_CHROME_HEADLESS_ARGS_DICT = _parse_static_args(CHROME_HEADLESS_ARGS)
+_CHROME_DISABLE_SECURITY_ARGS_DICT = _parse_static_args(CHROME_DISABLE_SECURITY_ARGS)
+_CHROME_DETERMINISTIC_RENDERING_ARGS_DICT = _parse_static_args(CHROME_DETERMINISTIC_RENDERING_ARGS)
+
+
 # ===== API-specific Models =====
 
 
@@ -485,7 +555,7 @@ class BrowserNewContextArgs(BrowserContextArgs):
 	https://playwright.dev/python/docs/api/class-browser#browser-new-context
 	"""
 
-	model_config = ConfigDict(extra='ignore', validate_assignment=False, revalidate_instances='always', populate_by_name=True)
+	model_config = _CONTEXT_ARGS_CONFIG
 
 	# storage_state is not supported in launch_persistent_context()
 	storage_state: str | Path | dict[str, Any] | None = None
@@ -520,12 +590,19 @@ class BrowserLaunchPersistentContextArgs(BrowserLaunchArgs, BrowserContextArgs):
 	https://playwright.dev/python/docs/api/class-browsertype#browser-type-launch-persistent-context
 	"""
 
-	model_config = ConfigDict(extra='ignore', validate_assignment=False, revalidate_instances='always')
+	model_config = _CONTEXT_ARGS_CONFIG
 
 	# Required parameter specific to launch_persistent_context, but can be None to use incognito temp dir
 	user_data_dir: str | Path | None = BROWSERUSE_PROFILES_DIR / 'default'
 
 
+# fields each kwargs_for_*() target model declares, used to avoid dumping the rest of the profile (args are rebuilt by get_args())
+_LAUNCH_PERSISTENT_CONTEXT_FIELDS = frozenset(BrowserLaunchPersistentContextArgs.model_fields) - {'args'}
+_NEW_CONTEXT_FIELDS = frozenset(BrowserNewContextArgs.model_fields)
+_CONNECT_FIELDS = frozenset(BrowserConnectArgs.model_fields)
+_LAUNCH_FIELDS = frozenset(BrowserLaunchArgs.model_fields) - {'args'}
+
+
 class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, BrowserLaunchArgs, BrowserNewContextArgs):
 	"""
 	A BrowserProfile is a static collection of kwargs that get passed to:
@@ -537,15 +614,7 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		- BrowserSession(**BrowserProfile)
 	"""
 
-	model_config = ConfigDict(
-		extra='ignore',
-		validate_assignment=True,
-		revalidate_instances='always',
-		from_attributes=True,
-		validate_by_name=True,
-		validate_by_alias=True,
-		populate_by_name=True,
-	)
+	model_config = _LAUNCH_ARGS_CONFIG
 
 	# ... extends options defined in:
 	# BrowserLaunchPersistentContextArgs, BrowserLaunchArgs, BrowserNewContextArgs, BrowserConnectArgs
@@ -566,8 +635,6 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		default=None,
 		description='Window size to use for the browser when headless=False.',
 	)
-	window_height: int | None = Field(default=None, description='DEPRECATED, use window_size["height"] instead', exclude=True)
-	window_width: int | None = Field(default=None, description='DEPRECATED, use window_size["width"] instead', exclude=True)
 	window_position: ViewportSize | None = Field(
 		default_factory=lambda: {'width': 0, 'height': 0},
 		description='Window position to use for the browser x,y from the top left when headless=False.',
@@ -605,11 +672,13 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 
 	# # --- File paths ---
 	downloads_dir: Path | str = Field(
-		default=Path('~/.config/browseruse/downloads').expanduser(),
+		default=BROWSERUSE_CONFIG_DIR / 'downloads',
 		description='Directory for downloads.',
 	)
 	# uploads_dir: Path | None = Field(default=None, description='Directory for uploads (defaults to downloads_dir if not set).')
 
+	_cached_args: tuple[tuple, list[str]] | None = PrivateAttr(default=None)  # (inputs key, get_args() result)
+
 	def __repr__(self) -> str:
 		short_dir = str(self.user_data_dir).replace(str(Path('~').expanduser()), '~')
 		return f'BrowserProfile(user_data_dir={short_dir}, headless={self.headless})'
@@ -617,69 +686,113 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 	def __str__(self) -> str:
 		return repr(self)
 
-	@model_validator(mode='after')
-	def copy_old_config_names_to_new(self) -> Self:
-		"""Copy old config window_width & window_height to window_size."""
-		if self.window_width or self.window_height:
-			self.window_size = self.window_size or {}
-			self.window_size['width'] = (self.window_size or {}).get('width') or self.window_width or 1280
-			self.window_size['height'] = (self.window_size or {}).get('height') or self.window_height or 1100
-		return self
+	@model_validator(mode='before')
+	@classmethod
+	def copy_old_config_names_to_new(cls, data: Any) -> Any:
+		"""Copy old config window_width & window_height to window_size (DEPRECATED, they are not fields on the model anymore)."""
+		if isinstance(data, dict) and ('window_width' in data or 'window_height' in data):
+			data = dict(data)
+			window_width = data.pop('window_width', None)
+			window_height = data.pop('window_height', None)
+			if window_width or window_height:
+				window_size = data.get('window_size') or {}
+				data['window_size'] = {
+					'width': window_size.get('width') or window_width or 1280,
+					'height': window_size.get('height') or window_height or 1100,
+				}
+		return data
+
+	def _set_unvalidated(self, **values: Any) -> None:
+		"""
+		Assign already-validated field values directly, bypassing validate_assignment=True.
+
+		Every normal assignment re-validates the field and re-runs all the model validators,
+		which adds up quickly in methods that adjust many config fields at once.
+		Callers are responsible for re-checking any cross-field invariants the new values could break.
+		"""
+		self.__dict__.update(values)
+		self.__pydantic_fields_set__.update(values)
 
 	def get_args(self) -> list[str]:
-		if isinstance(self.ignore_default_args, list):
-			default_args = set(CHROME_DEFAULT_ARGS) - set(self.ignore_default_args)
-		elif self.ignore_default_args is True:
-			default_args = []
-		elif not self.ignore_default_args:
-			default_args = CHROME_DEFAULT_ARGS
-
-		return BrowserLaunchArgs.args_as_list(  # convert back to ['--arg=value', '--arg', '--arg=value', ...]
-			BrowserLaunchArgs.args_as_dict(  # uniquify via dict {'arg': 'value', 'arg2': 'value2', ...}
-				[
-					*default_args,
-					*self.args,
-					f'--profile-directory={self.profile_directory}',
-					*(CHROME_DOCKER_ARGS if IN_DOCKER else []),
-					*(CHROME_HEADLESS_ARGS if self.headless else []),
-					*(CHROME_DISABLE_SECURITY_ARGS if self.disable_security else []),
-					*(CHROME_DETERMINISTIC_RENDERING_ARGS if self.deterministic_rendering else []),
-					*(
-						[f'--window-size={self.window_size["height"]},{self.window_size["width"]}']
-						if self.window_size
-						else (['--start-maximized'] if not self.headless else [])
-					),
-					*(
-						[f'--window-position={self.window_position["width"]},{self.window_position["height"]}']
-						if self.window_position
-						else []
-					),
-				]
-			)
+		# get_args() is called by several kwargs_for_*() helpers per launch, reuse the last result if none of its inputs changed
+		cache_key = (
+			tuple(self.args),
+			tuple(self.ignore_default_args) if isinstance(self.ignore_default_args, list) else self.ignore_default_args,
+			self.headless,
+			self.disable_security,
+			self.deterministic_rendering,
+			self.profile_directory,
+			str(self.window_size),
+			str(self.window_position),
 		)
+		if self._cached_args and self._cached_args[0] == cache_key:
+			return list(self._cached_args[1])
+
+		# merge every source into one ordered dict in a single pass, in priority order (later sources override earlier ones),
+		# only the user-supplied/dynamic args get parsed per call, the static CHROME_*_ARGS are pre-parsed at import time
+		args: dict[str, str] = {}
+		# --disable-features may be passed by several sources, merge their feature lists instead of letting the last one win
+		disabled_features: dict[str, None] = {}  # dict used as an ordered set
+
+		def merge_args(new_args: dict[str, str]) -> None:
+			for key, value in new_args.items():
+				if key == 'disable-features':
+					disabled_features.update(dict.fromkeys(filter(None, value.split(','))))
+				else:
+					args[key] = value
+
+		if self.ignore_default_args is not True:
+			ignored_keys = BrowserLaunchArgs.args_as_dict(self.ignore_default_args).keys() if self.ignore_default_args else ()
+			args.update((key, value) for key, value in _CHROME_DEFAULT_ARGS_DICT.items() if key not in ignored_keys)
+			if 'disable-features' not in ignored_keys:
+				disabled_features.update(_CHROME_DEFAULT_DISABLED_FEATURES)
+
+		merge_args(BrowserLaunchArgs.args_as_dict(self.args))
+		args['profile-directory'] = self.profile_directory
+		if IN_DOCKER:
+			merge_args(_CHROME_DOCKER_ARGS_DICT)
+		if self.headless:
+			merge_args(_CHROME_HEADLESS_ARGS_DICT)
+		if self.disable_security:
+			merge_args(_CHROME_DISABLE_SECURITY_ARGS_DICT)
+		if self.deterministic_rendering:
+			merge_args(_CHROME_DETERMINISTIC_RENDERING_ARGS_DICT)
+		if disabled_features:
+			args['disable-features'] = ','.join(disabled_features)
+		if self.window_size:
+			args['window-size'] = f'{self.window_size["height"]},{self.window_size["width"]}'
+		elif not self.headless:
+			args['start-maximized'] = ''
+		if self.window_position:
+			args['window-position'] = f'{self.window_position["width"]},{self.window_position["height"]}'
+
+		args_list = BrowserLaunchArgs.args_as_list(args)  # convert back to ['--arg=value', '--arg', '--arg=value', ...]
+		self._cached_args = (cache_key, args_list)
+		return list(args_list)
 
 	def kwargs_for_launch_persistent_context(self) -> BrowserLaunchPersistentContextArgs:
 		"""Return the kwargs for BrowserType.launch()."""
-		return BrowserLaunchPersistentContextArgs(**self.model_dump(exclude={'args'}), args=self.get_args())
+		return BrowserLaunchPersistentContextArgs.model_construct(
+			**self.model_dump(include=_LAUNCH_PERSISTENT_CONTEXT_FIELDS), args=self.get_args()
+		)
 
 	def kwargs_for_new_context(self) -> BrowserNewContextArgs:
 		"""Return the kwargs for BrowserContext.new_context()."""
-		return BrowserNewContextArgs(**self.model_dump(exclude={'args'}), args=self.get_args())
+		return BrowserNewContextArgs.model_construct(**self.model_dump(include=_NEW_CONTEXT_FIELDS))
 
 	def kwargs_for_connect(self) -> BrowserConnectArgs:
 		"""Return the kwargs for BrowserType.connect()."""
-		return BrowserConnectArgs(**self.model_dump(exclude={'args'}), args=self.get_args())
+		return BrowserConnectArgs.model_construct(**self.model_dump(include=_CONNECT_FIELDS))
 
 	def kwargs_for_launch(self) -> BrowserLaunchArgs:
 		"""Return the kwargs for BrowserType.connect_over_cdp()."""
-		return BrowserLaunchArgs(**self.model_dump(exclude={'args'}), args=self.get_args())
+		return BrowserLaunchArgs.model_construct(**self.model_dump(include=_LAUNCH_FIELDS), args=self.get_args())
 
 	def prepare_user_data_dir(self) -> None:
 		"""Create and unlock the user data dir for first-run initialization."""
 
 		if self.user_data_dir:
-			self.user_data_dir = Path(self.user_data_dir).expanduser().resolve()
-			self.user_data_dir.mkdir(parents=True, exist_ok=True)
+			self._set_unvalidated(user_data_dir=_prepare_dir(self.user_data_dir))
 
 			# clear any existing locks by any other chrome processes (hacky)
 			# helps stop chrome crashes from leaving the profile dir in a locked state and breaking subsequent runs,
@@ -692,8 +805,7 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 				)
 
 		if self.downloads_dir:
-			self.downloads_dir = Path(self.downloads_dir).expanduser().resolve()
-			self.downloads_dir.mkdir(parents=True, exist_ok=True)
+			self._set_unvalidated(downloads_dir=_prepare_dir(self.downloads_dir))
 
 	# def preinstall_extensions(self) -> None:
 	# 	"""Preinstall the extensions."""
@@ -717,42 +829,63 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		        screen, window_size, window_position, viewport, no_viewport, device_scale_factor
 		"""
 
-		display_size = get_display_size()
-		if display_size:
-			self.screen = self.screen or display_size or ViewportSize(width=1280, height=1100)
+		# all the values are computed in locals first and then written back in a single batch at the end
+		headless, no_viewport, viewport = self.headless, self.no_viewport, self.viewport
+		window_size, window_position = self.window_size, self.window_position
+		device_scale_factor, screen = self.device_scale_factor, self.screen
+
+		# the display size is only looked up as a fallback for values that aren't configured yet (note the short-circuiting `or`s),
+		# so a fully specified config never pays for the (slow on first call) AppKit / screeninfo display lookup.
+		# the fallbacks use a fresh copy each, the cached get_display_size() dict must not be shared between fields / profiles
 
 		# if no headless preference specified, prefer headful if there is a display available
-		if self.headless is None:
-			self.headless = not bool(display_size)
+		if headless is None:
+			headless = not bool(get_display_size())
 
 		# set up window size and position if headful
-		if self.headless:
+		if headless:
 			# headless mode: no window available, use viewport instead to constrain content size
-			self.window_size = None
-			self.window_position = None
-			self.no_viewport = False
-			self.viewport = self.viewport or display_size or ViewportSize(width=1280, height=1100)
+			window_size = None
+			window_position = None
+			no_viewport = False
+			viewport = viewport or _get_display_size_copy() or ViewportSize(width=1280, height=1100)
 		else:
 			# headful mode: use window, disable viewport, content fits to size of window
-			self.window_size = self.window_size or display_size or ViewportSize(width=1280, height=1100)
-			self.no_viewport = True if self.no_viewport is None else self.no_viewport
-			self.viewport = None if self.no_viewport else self.viewport
+			window_size = window_size or _get_display_size_copy() or ViewportSize(width=1280, height=1100)
+			no_viewport = True if no_viewport is None else no_viewport
+			viewport = None if no_viewport else viewport
 
 			# Auto-inherit DISPLAY environment variable for headful mode
 			if 'DISPLAY' in os.environ and 'DISPLAY' not in self.env:
 				self.env['DISPLAY'] = os.environ['DISPLAY']
 
 		# automatically setup viewport if any config requires it
-		use_viewport = self.headless or self.viewport or self.device_scale_factor
-		self.no_viewport = not use_viewport if self.no_viewport is None else self.no_viewport
-		use_viewport = not self.no_viewport
+		use_viewport = headless or viewport or device_scale_factor
+		no_viewport = not use_viewport if no_viewport is None else no_viewport
+		use_viewport = not no_viewport
 		if use_viewport:
 			# if we are using viewport, make device_scale_factor and screen are set to real values to avoid easy fingerprinting
-			self.viewport = self.viewport or display_size or ViewportSize(width=1280, height=1100)
-			self.device_scale_factor = self.device_scale_factor or 1.0
-			self.screen = self.screen or display_size or ViewportSize(width=1280, height=1100)
+			viewport = viewport or _get_display_size_copy() or ViewportSize(width=1280, height=1100)
+			device_scale_factor = device_scale_factor or 1.0
+			screen = screen or _get_display_size_copy() or ViewportSize(width=1280, height=1100)
 		else:
 			# device_scale_factor and screen are not supported non-viewport mode, the system monitor determines these
-			self.viewport = None
-			self.device_scale_factor = None
-			self.screen = None
+			viewport = None
+			device_scale_factor = None
+			screen = None
+
+		# headless is checked by the model validators (e.g. against devtools), so it's written with a normal validated
+		# assignment that raises the usual ValidationError, before any of the other fields are changed
+		if headless != self.headless:
+			self.headless = headless
+
+		# the remaining values are either the profile's own already-validated field values, fresh ViewportSize copies
+		# (never the cached get_display_size() dict itself), or plain bools / floats / None, so validation can be skipped
+		self._set_unvalidated(
+			no_viewport=no_viewport,
+			viewport=viewport,
+			window_size=window_size,
+			window_position=window_position,
+			device_scale_factor=device_scale_factor,
+			screen=screen,
+		)
@@ -260,7 +260,7 @@ class BrowserSession(BaseModel):
 			try:
 				await (self.browser_context or self.browser).close()
 				logger.info(
-					f'🛑 Stopped the {self.browser_profile.channel.name.lower()} browser '
+					f'🛑 Stopped the {self.browser_profile.channel} browser '
 					f'keep_alive=False user_data_dir={_log_pretty_path(self.browser_profile.user_data_dir) or "<incognito>"} cdp_url={self.cdp_url or self.wss_url} pid={self.browser_pid}'
 				)
 				self.browser_context = None
@@ -398,7 +398,7 @@ class BrowserSession(BaseModel):
 		if not self.browser_context:
 			logger.info(
 				f'🌎 Launching local browser '
-				f'driver={str(type(self.playwright).__module__).split(".")[0]} channel={self.browser_profile.channel.name.lower()} '
+				f'driver={str(type(self.playwright).__module__).split(".")[0]} channel={self.browser_profile.channel} '
 				f'user_data_dir={_log_pretty_path(self.browser_profile.user_data_dir) if self.browser_profile.user_data_dir else "<incognito>"}'
 			)
 			if not self.browser_profile.user_data_dir:
@@ -618,7 +618,7 @@ class BrowserSession(BaseModel):
 			+ (f'viewport={viewport["width"]}x{viewport["height"]}px ' if viewport else '(no viewport) ')
 			+ f'device_scale_factor={self.browser_profile.device_scale_factor or 1.0} '
 			+ f'is_mobile={self.browser_profile.is_mobile} '
-			+ (f'color_scheme={self.browser_profile.color_scheme.value} ' if self.browser_profile.color_scheme else '')
+			+ (f'color_scheme={self.browser_profile.color_scheme} ' if self.browser_profile.color_scheme else '')
 			+ (f'locale={self.browser_profile.locale} ' if self.browser_profile.locale else '')
 			+ (f'timezone_id={self.browser_profile.timezone_id} ' if self.browser_profile.timezone_id else '')
 			+ (f'geolocation={self.browser_profile.geolocation} ' if self.browser_profile.geolocation else '')
@@ -1,7 +1,9 @@
 import os
 
 import pytest
+from pydantic import ValidationError
 
+from browser_use.browser import profile as profile_module
 from browser_use.browser.profile import BrowserProfile, ProxySettings
 from browser_use.browser.session import BrowserSession
 
@@ -54,6 +56,153 @@ async def test_window_size_config():
 	assert profile2.window_size['height'] == 1080
 
 
+@pytest.mark.asyncio
+async def test_deprecated_window_width_height_config():
+	"""
+	Test that the deprecated window_width/window_height kwargs are copied into window_size.
+	"""
+	profile = BrowserProfile(window_width=1024, window_height=768)
+	assert profile.window_size == {'width': 1024, 'height': 768}
+	assert 'window_width' not in profile.model_dump()
+
+	# missing dimensions fall back to the defaults, explicit window_size values take precedence
+	assert BrowserProfile(window_width=1024).window_size == {'width': 1024, 'height': 1100}
+	assert BrowserProfile(window_width=1024, window_size={'width': 800, 'height': 600}).window_size == {
+		'width': 800,
+		'height': 600,
+	}
+
+
+@pytest.mark.asyncio
+async def test_disable_features_args_are_merged():
+	"""
+	Test that --disable-features passed by multiple sources are merged instead of the last one overriding the others.
+	"""
+	profile = BrowserProfile(args=['--disable-features=SomeUserFeature'], disable_security=True)
+
+	disable_features_args = [arg for arg in profile.get_args() if arg.startswith('--disable-features=')]
+	assert len(disable_features_args) == 1
+
+	disabled_features = disable_features_args[0].split('=', 1)[1].split(',')
+	assert 'SomeUserFeature' in disabled_features  # from args
+	assert 'IsolateOrigins' in disabled_features  # from disable_security
+	assert 'Translate' in disabled_features  # from the defaults
+	assert len(disabled_features) == len(set(disabled_features))
+
+	# ignoring the default --disable-features should only leave the explicitly passed features
+	profile = BrowserProfile(args=['--disable-features=SomeUserFeature'], ignore_default_args=['--disable-features'])
+	assert '--disable-features=SomeUserFeature' in profile.get_args()
+
+
+@pytest.mark.asyncio
+async def test_base_url_validation():
+	"""
+	Test that base_url accepts the same URLs as urlparse() based validation: a valid scheme (or none) plus a netloc.
+	"""
+	for valid_url in ['https://example.com', 'http://example.com:8080/path?q=1', 'chrome-extension://abc', '//example.com/a']:
+		assert BrowserProfile(base_url=valid_url).base_url == valid_url
+
+	for invalid_url in [
+		'example.com',
+		'://example.com',
+		'example.com/?next=http://other.com',
+		'foo bar://baz',
+		'data:text/html,<a href=http://example.com>',
+		'http:///path',
+		'http://?query',
+	]:
+		with pytest.raises(ValueError, match='Invalid URL format'):
+			BrowserProfile(base_url=invalid_url)
+
+	assert profile_module.validate_url('HTTPS://example.com', ('http', 'https')) == 'HTTPS://example.com'
+	with pytest.raises(ValueError, match='URL has invalid scheme'):
+		profile_module.validate_url('ftp://example.com', ('http', 'https'))
+
+
+@pytest.mark.asyncio
+async def test_detect_display_configuration_rejects_headless_devtools(monkeypatch):
+	"""
+	Test that falling back to headless=True when no display is available still rejects devtools=True.
+	"""
+	monkeypatch.setattr(profile_module, 'get_display_size', lambda: None)
+
+	profile = BrowserProfile(headless=None, devtools=True)
+	with pytest.raises(ValidationError, match='headless=True and devtools=True cannot both be set'):
+		profile.detect_display_configuration()
+
+
+@pytest.mark.asyncio
+async def test_detect_display_configuration_copies_display_size(monkeypatch):
+	"""
+	Test that the detected display size is copied into each field instead of sharing the cached get_display_size() dict.
+	"""
+	display_size = {'width': 1920, 'height': 1080}
+	monkeypatch.setattr(profile_module, 'get_display_size', lambda: display_size)
+
+	profile = BrowserProfile(headless=True)
+	profile.detect_display_configuration()
+	assert profile.viewport == profile.screen == display_size
+	assert profile.viewport is not profile.screen
+	assert profile.viewport is not profile_module.get_display_size()
+	assert profile.screen is not profile_module.get_display_size()
+
+	headful_profile = BrowserProfile(headless=False)
+	headful_profile.detect_display_configuration()
+	assert headful_profile.window_size == display_size
+	assert headful_profile.window_size is not profile_module.get_display_size()
+
+	# editing one profile must not leak into the cached display size or other profiles
+	profile.viewport['width'] = 800
+	assert profile.screen['width'] == 1920
+	assert headful_profile.window_size['width'] == 1920
+	assert profile_module.get_display_size()['width'] == 1920
+
+
+@pytest.mark.asyncio
+async def test_prepare_user_data_dir_is_memoized(tmp_path, monkeypatch):
+	"""
+	Test that prepare_user_data_dir() skips re-creating already prepared dirs, but still follows the
+	current working directory for relative paths and re-creates dirs that were deleted in the meantime.
+	"""
+	first_cwd, second_cwd = tmp_path / 'first', tmp_path / 'second'
+	first_cwd.mkdir()
+	second_cwd.mkdir()
+
+	monkeypatch.chdir(first_cwd)
+	profile = BrowserProfile(user_data_dir='profile', downloads_dir='downloads')
+	profile.prepare_user_data_dir()
+	assert profile.user_data_dir == (first_cwd / 'profile').resolve()
+	assert profile.user_data_dir.is_dir()
+
+	# memo hit: the same dir prepared again must not be re-created
+	def fail_mkdir(*args, **kwargs):
+		raise AssertionError('mkdir() should not be called for an already prepared dir')
+
+	with monkeypatch.context() as m:
+		m.setattr(profile_module.Path, 'mkdir', fail_mkdir)
+		profile = BrowserProfile(user_data_dir='profile', downloads_dir='downloads')
+		profile.prepare_user_data_dir()
+		assert profile.user_data_dir == (first_cwd / 'profile').resolve()
+
+	# relative paths are resolved against the new working directory, not served stale from the memo
+	monkeypatch.chdir(second_cwd)
+	profile = BrowserProfile(user_data_dir='profile', downloads_dir='downloads')
+	profile.prepare_user_data_dir()
+	assert profile.user_data_dir == (second_cwd / 'profile').resolve()
+	assert profile.user_data_dir.is_dir()
+
+	# a deleted dir gets re-created even though it was prepared before
+	profile.user_data_dir.rmdir()
+	profile = BrowserProfile(user_data_dir='profile', downloads_dir='downloads')
+	profile.prepare_user_data_dir()
+	assert profile.user_data_dir.is_dir()
+
+	# absolute paths are still canonicalized, since they end up in --user-data-dir= and are compared as strings
+	profile = BrowserProfile(user_data_dir=str(first_cwd / '..' / 'second' / 'other'), downloads_dir='downloads')
+	profile.prepare_user_data_dir()
+	assert profile.user_data_dir == (second_cwd / 'other').resolve()
+
+
 @pytest.mark.asyncio
 @pytest.mark.skipif(os.environ.get('CI') == 'true', reason='Skip browser test in CI')
 async def test_window_size_with_real_browser():